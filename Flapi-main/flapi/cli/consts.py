@@ -17,3 +17,12 @@ CONNECTION_TIMEOUT = 60.0
 """
 The maximum duration to wait for a connection with FL Studio
 """
+
+
+CONNECTION_FAILED_MESSAGE = "\n".join([
+    "Flapi could not connect to FL Studio.",
+    "Please verify that FL Studio is running and the server is installed",
+])
+"""
+Message displayed when the REPL fails to connect to FL Studio
+"""
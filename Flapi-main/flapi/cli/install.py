@@ -4,7 +4,7 @@
 Simple script for installing the Flapi server into FL Studio
 """
 import click
-from shutil import copytree, rmtree
+from shutil import copyfile, copytree, rmtree
 from pathlib import Path
 from . import consts
 from .util import yn_prompt, output_dir, server_dir
@@ -56,7 +56,9 @@ def install(data_dir: Path, yes: bool = False, dev: bool = False):
     if dev:
         output_location.symlink_to(script_location, True)
     else:
-        copytree(script_location, output_location)
+        # FL Studio doesn't care about the server scripts' metadata, so skip
+        # copying it for each file (directories still get theirs)
+        copytree(script_location, output_location, copy_function=copyfile)
 
     print(
         "Success! Make sure you restart FL Studio so the server is registered"
@@ -222,9 +222,11 @@ def repl(
 ):
     """Main function to set up the Python shell"""
     handle_verbose(verbose)
-    print("Flapi interactive shell")
-    print(f"Client version: {flapi.__version__}")
-    print(f"Python version: {sys.version}")
+    print("\n".join([
+        "Flapi interactive shell",
+        f"Client version: {flapi.__version__}",
+        f"Python version: {sys.version}",
+    ]))
 
     # Set up the connection
     status = enable(req, res)
@@ -236,24 +238,22 @@ def repl(
         if status:
             start_server_shell()
         else:
-            print("Flapi could not connect to FL Studio.")
-            print(
-                "Please verify that FL Studio is running and the server is "
-                "installed"
-            )
-            print("Then, run this command again.")
+            print("\n".join([
+                cli_consts.CONNECTION_FAILED_MESSAGE,
+                "Then, run this command again.",
+            ]))
             exit(1)
 
     if not status:
-        print("Flapi could not connect to FL Studio.")
-        print(
-            "Please verify that FL Studio is running and the server is "
-            "installed"
-        )
-        print("Then, run `init()` to create the connection.")
-
-    print("Imported functions:")
-    print(", ".join(SHELL_SCOPE.keys()))
+        print("\n".join([
+            cli_consts.CONNECTION_FAILED_MESSAGE,
+            "Then, run `init()` to create the connection.",
+        ]))
+
+    print("\n".join([
+        "Imported functions:",
+        ", ".join(SHELL_SCOPE.keys()),
+    ]))
 
     if shell == "python":
         return start_python_shell()
@@ -112,7 +112,11 @@ class FlapiComms:
         if mido_msg is None:
             return None
 
-        # We received something
+        # We received something, but only sysex messages can be Flapi
+        # messages, so skip trying to parse anything else
+        if mido_msg.type != "sysex":
+            return mido_msg.bytes()
+
         # Make sure to remove the start and end bits to simplify processing
         try:
             msg = FlapiMsg(bytes(mido_msg.bytes()[1:-1]))
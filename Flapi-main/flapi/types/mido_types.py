@@ -12,6 +12,8 @@ MessageType = Literal["sysex", "note_on", "note_off"]
 
 if TYPE_CHECKING:
     class MidoMsg:
+        type: MessageType
+
         def __init__(self, type: str, *, data: bytes | None = None) -> None:
             super().__init__()
 
@@ -19,6 +19,18 @@ except ImportError:
     pass
 
 
+HEADER_END = len(SYSEX_HEADER) + 1
+"""
+Index of the end of the Flapi header within a sysex message (including the
+`0xF0` status byte)
+"""
+
+RESPONSE_PREFIX = bytes([0xF0]) + SYSEX_HEADER + bytes([MessageOrigin.SERVER])
+"""
+Start of every message forwarded back to the client
+"""
+
+
 def OnInit():
     print("\n".join([
         "Flapi response server",
@@ -34,10 +46,10 @@ def OnInit():
 
 
 def OnSysEx(event: 'FlMidiMsg'):
-    header = event.sysex[1:len(SYSEX_HEADER)+1]  # Sysex header
+    header = event.sysex[1:HEADER_END]  # Sysex header
     # print_msg("Header", header)
     # Remaining sysex data
-    sysex_data = event.sysex[len(SYSEX_HEADER)+1:]
+    sysex_data = event.sysex[HEADER_END:]
     # print_msg("Data", sysex_data)
 
     # Ignore events that don't target the respond script
@@ -59,12 +71,7 @@ def OnSysEx(event: 'FlMidiMsg'):
     #     )
     # )
 
-    device.midiOutSysex(
-        bytes([0xF0])
-        + SYSEX_HEADER
-        + bytes([MessageOrigin.SERVER])
-        + sysex_data[1:]
-    )
+    device.midiOutSysex(RESPONSE_PREFIX + sysex_data[1:])
 
 
 def OnDeInit():
@@ -72,9 +79,7 @@ def OnDeInit():
     Send server goodbye message
     """
     device.midiOutSysex(
-        bytes([0xF0])
-        + SYSEX_HEADER
-        + bytes([MessageOrigin.SERVER])
+        RESPONSE_PREFIX
         # Target all clients by giving 0x00 client ID
         + bytes([0x00])
         + bytes([MessageType.SERVER_GOODBYE])
@@ -6,7 +6,6 @@ Wrapper class for MIDI messages sent/received by Flapi.
 from flapi import _consts as consts
 from flapi._consts import MessageType, MessageOrigin, MessageStatus
 from typing import overload
-import itertools as iter
 from .errors import FlapiInvalidMsgError
 
 
@@ -15,6 +14,11 @@ class FlapiMsg:
     Wrapper for Flapi messages, allowing for convenient access to their
     properties.
     """
+    __data_chunks: list[bytes]
+    """
+    Parts of the additional data, joined lazily when it is accessed
+    """
+
     @overload
     def __init__(
         self,
@@ -50,7 +54,7 @@ class FlapiMsg:
             self.continuation = False
             self.msg_type: MessageType | int = msg_type  # type: ignore
             self.status_code: MessageStatus = status  # type: ignore
-            self.additional_data: bytes = (
+            self.additional_data = (
                 additional_data
                 if additional_data is not None
                 else bytes()
@@ -95,7 +99,22 @@ class FlapiMsg:
         assert self.status_code == other.status_code
 
         self.continuation = other.continuation
-        self.additional_data += other.additional_data
+        # Defer joining the data until it is accessed, so that receiving a
+        # message split into many parts doesn't copy it every time
+        self.__data_chunks.append(other.additional_data)
+
+    @property
+    def additional_data(self) -> bytes:
+        """
+        Additional data contained in the message.
+        """
+        if len(self.__data_chunks) != 1:
+            self.__data_chunks = [b''.join(self.__data_chunks)]
+        return self.__data_chunks[0]
+
+    @additional_data.setter
+    def additional_data(self, data: bytes) -> None:
+        self.__data_chunks = [data]
 
     def to_bytes(self) -> list[bytes]:
         """
@@ -111,25 +130,25 @@ class FlapiMsg:
 
         * `list[bytes]`: MIDI message(s) to send.
         """
-        msgs: list[bytes] = []
-
-        # Append in reverse, so we can easily detect the last element (which
-        # shouldn't have its "continuation" byte set)
-        first = True
-        for data in reversed(list(
-            iter.batched(self.additional_data, consts.MAX_DATA_LEN)
-        )):
-            msgs.insert(0, bytes(
-                consts.SYSEX_HEADER
-                + bytes([
-                    self.origin,
-                    self.client_id,
-                    first,
-                    self.msg_type,
-                    self.status_code,
-                ])
-                + bytes(data)
-            ))
-            first = False
-
-        return msgs
+        # Slice the data directly, rather than batching it byte-by-byte. We
+        # always need at least one message, even if there's no data.
+        chunks = [
+            self.additional_data[i:i + consts.MAX_DATA_LEN]
+            for i in range(0, len(self.additional_data), consts.MAX_DATA_LEN)
+        ] or [bytes()]
+        last = len(chunks) - 1
+
+        # Build the messages in order, with every message except the last
+        # having its "continuation" byte set
+        return [
+            consts.SYSEX_HEADER
+            + bytes([
+                self.origin,
+                self.client_id,
+                i != last,
+                self.msg_type,
+                self.status_code,
+            ])
+            + data
+            for i, data in enumerate(chunks)
+        ]